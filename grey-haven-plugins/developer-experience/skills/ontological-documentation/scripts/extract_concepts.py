@@ -8,6 +8,7 @@ and can identify inheritance hierarchies, composition patterns, and semantic rel
 """
 
 import ast
+import os
 import re
 import json
 import sys
@@ -15,6 +16,19 @@ from pathlib import Path
 from typing import Dict, List, Set, Tuple, Any
 from collections import defaultdict
 
+# Vendored, generated and tooling directories that never hold domain concepts
+SKIP_DIRS = frozenset({
+    'node_modules', '.git', 'venv', '.venv', '__pycache__', 'dist', 'build',
+    '.next', '.nuxt', 'target', '.tox', '.mypy_cache', '.pytest_cache', 'vendor'
+})
+
+JS_SUFFIXES = frozenset({'.js', '.ts', '.jsx', '.tsx'})
+
+# JavaScript/TypeScript declaration patterns, compiled once for every file scanned
+JS_CLASS_RE = re.compile(r'(?:class|interface)\s+(\w+)(?:\s+extends\s+(\w+))?')
+JS_FUNCTION_RE = re.compile(r'(?:function\s+(\w+)|const\s+(\w+)\s*=\s*(?:\([^)]*\)\s*)?=>|(\w+)\s*:\s*\([^)]*\)\s*=>)')
+JS_IMPORT_RE = re.compile(r'import\s+.*?from\s+["\']([^"\']+)["\']')
+
 class ConceptExtractor:
     """Extracts ontological concepts from source code."""
 
@@ -55,8 +69,7 @@ class ConceptExtractor:
                 content = f.read()
 
             # Extract class declarations
-            class_pattern = r'(?:class|interface)\s+(\w+)(?:\s+extends\s+(\w+))?'
-            for match in re.finditer(class_pattern, content):
+            for match in JS_CLASS_RE.finditer(content):
                 class_name = match.group(1)
                 parent_class = match.group(2)
                 concepts['classes'].append({
@@ -66,15 +79,13 @@ class ConceptExtractor:
                 })
 
             # Extract function declarations
-            func_pattern = r'(?:function\s+(\w+)|const\s+(\w+)\s*=\s*(?:\([^)]*\)\s*)?=>|(\w+)\s*:\s*\([^)]*\)\s*=>)'
-            for match in re.finditer(func_pattern, content):
+            for match in JS_FUNCTION_RE.finditer(content):
                 func_name = match.group(1) or match.group(2) or match.group(3)
                 if func_name:
                     concepts['functions'].append({'name': func_name})
 
             # Extract imports
-            import_pattern = r'import\s+.*?from\s+["\']([^"\']+)["\']'
-            for match in re.finditer(import_pattern, content):
+            for match in JS_IMPORT_RE.finditer(content):
                 concepts['imports'].append({'source': match.group(1)})
 
         except Exception as e:
@@ -232,17 +243,20 @@ def main():
         if path.suffix == '.py':
             data = extractor.extract_from_python(path)
             extracted_data.append(data)
-        elif path.suffix in ['.js', '.ts', '.jsx', '.tsx']:
+        elif path.suffix in JS_SUFFIXES:
             data = extractor.extract_from_javascript(path)
             extracted_data.append(data)
     elif path.is_dir():
-        for file_path in path.rglob('*'):
-            if file_path.is_file():
-                if file_path.suffix == '.py':
-                    data = extractor.extract_from_python(file_path)
+        for root, dirs, files in os.walk(path):
+            # Prune in place so os.walk never descends into skipped directories
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            for name in files:
+                suffix = os.path.splitext(name)[1]
+                if suffix == '.py':
+                    data = extractor.extract_from_python(Path(root, name))
                     extracted_data.append(data)
-                elif file_path.suffix in ['.js', '.ts', '.jsx', '.tsx']:
-                    data = extractor.extract_from_javascript(file_path)
+                elif suffix in JS_SUFFIXES:
+                    data = extractor.extract_from_javascript(Path(root, name))
                     extracted_data.append(data)
 
     ontology = extractor.build_ontology(extracted_data)
@@ -13,6 +13,9 @@ import re
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# Characters that are not valid in Mermaid/PlantUML/DOT identifiers
+UNSAFE_IDENT_CHARS_RE = re.compile(r'[^a-zA-Z0-9_]')
+
 class OntologyDiagramGenerator:
     """Generates diagrams for ontological documentation."""
 
@@ -223,7 +226,7 @@ class OntologyDiagramGenerator:
     def _safe_name(self, name: str) -> str:
         """Convert name to safe identifier for diagram formats."""
         # Replace special characters and spaces with underscores
-        return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+        return UNSAFE_IDENT_CHARS_RE.sub('_', name)
 
 def load_ontology(file_path: Path) -> Dict[str, Any]:
     """Load ontology from JSON file."""
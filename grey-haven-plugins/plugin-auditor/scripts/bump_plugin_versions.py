@@ -21,7 +21,9 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+import shutil
 import sys
 from pathlib import Path
 
@@ -33,6 +35,25 @@ def find_plugin_jsons(plugins_dir: Path) -> list[Path]:
     return sorted(plugins_dir.glob("*/.claude-plugin/plugin.json"))
 
 
+def write_json(path: Path, data: dict, previous: str) -> None:
+    """Write `data` to `path` via a sibling temp file and an atomic rename.
+
+    Skips the write when the serialized text matches `previous`, the file's
+    current contents.
+    """
+    text = json.dumps(data, indent=4) + "\n"
+    if text == previous:
+        return
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        tmp.write_text(text)
+        shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def bump_semver(current: str, bump_type: str) -> str:
     m = SEMVER_RE.match(current)
     if not m:
@@ -87,20 +108,21 @@ def main(argv: list[str]) -> int:
         print(f"No plugin.json files under {args.plugins_dir}", file=sys.stderr)
         return 2
 
-    current: dict[Path, tuple[str, dict]] = {}
+    current: dict[Path, tuple[str, dict, str]] = {}
     for p in plugin_jsons:
+        raw = p.read_text()
         try:
-            data = json.loads(p.read_text())
+            data = json.loads(raw)
         except json.JSONDecodeError as e:
             print(f"Invalid JSON in {p}: {e}", file=sys.stderr)
             return 2
-        current[p] = (str(data.get("version", "0.0.0")), data)
+        current[p] = (str(data.get("version", "0.0.0")), data, raw)
 
-    distinct = sorted({v for v, _ in current.values()})
+    distinct = sorted({v for v, _, _ in current.values()})
 
     if args.check:
-        width = max(len(v) for v, _ in current.values()) + 2
-        for p, (v, _) in current.items():
+        width = max(len(v) for v, _, _ in current.values()) + 2
+        for p, (v, _, _) in current.items():
             print(f"{v:<{width}}{p.parent.parent.name}")
         print()
         if len(distinct) == 1:
@@ -130,9 +152,9 @@ def main(argv: list[str]) -> int:
             return 2
 
     # Apply in place
-    for p, (_, data) in current.items():
+    for p, (_, data, raw) in current.items():
         data["version"] = new_version
-        p.write_text(json.dumps(data, indent=4) + "\n")
+        write_json(p, data, raw)
 
     print(f"Bumped {len(current)} plugins to {new_version}:")
     for p in current:
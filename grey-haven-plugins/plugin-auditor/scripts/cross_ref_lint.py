@@ -29,6 +29,7 @@ from __future__ import annotations
 import argparse
 import re
 import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -51,13 +52,12 @@ class Report:
         self.findings.append(Finding(path, line, kind, message))
 
     def by_kind(self) -> dict[str, int]:
-        counts: dict[str, int] = {}
-        for f in self.findings:
-            counts[f.kind] = counts.get(f.kind, 0) + 1
-        return counts
+        return dict(Counter(f.kind for f in self.findings))
 
 
 FRONTMATTER_RE = re.compile(r"\A---\n(.*?)\n---\n?(.*)", re.DOTALL)
+YAML_LIST_ITEM_RE = re.compile(r"^\s+-\s*(.+?)\s*$")
+YAML_KEY_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_-]*)\s*:\s*(.*)$")
 
 
 def parse_frontmatter(text: str) -> tuple[dict[str, object], str, int]:
@@ -88,7 +88,7 @@ def _parse_minimal_yaml(text: str) -> dict[str, object]:
         if not line or line.lstrip().startswith("#"):
             continue
         # List item continuation
-        m = re.match(r"^\s+-\s*(.+?)\s*$", line)
+        m = YAML_LIST_ITEM_RE.match(line)
         if m and current_list_key is not None:
             val = m.group(1).strip().strip('"').strip("'")
             lst = out.setdefault(current_list_key, [])
@@ -96,7 +96,7 @@ def _parse_minimal_yaml(text: str) -> dict[str, object]:
                 lst.append(val)
             continue
         # Key: value or Key: (start of list/block)
-        m = re.match(r"^([A-Za-z_][A-Za-z0-9_-]*)\s*:\s*(.*)$", line)
+        m = YAML_KEY_RE.match(line)
         if m:
             key, val = m.group(1), m.group(2).strip()
             if val == "":
@@ -110,20 +110,30 @@ def _parse_minimal_yaml(text: str) -> dict[str, object]:
     return out
 
 
-def collect_inventory(plugins_dir: Path) -> tuple[dict[str, Path], dict[str, Path]]:
-    """Map skill and agent names → source paths."""
+Parsed = tuple[dict[str, object], str, int]
+
+
+def parse_markdown_tree(plugins_dir: Path) -> dict[Path, Parsed]:
+    """Read and parse every markdown file under plugins_dir in one walk."""
+    return {
+        md: parse_frontmatter(md.read_text(errors="replace"))
+        for md in plugins_dir.rglob("*.md")
+    }
+
+
+def collect_inventory(
+    plugins_dir: Path, parsed: dict[Path, Parsed]
+) -> tuple[dict[str, Path], dict[str, Path]]:
+    """Map skill and agent names → source paths from an already-parsed tree."""
     skills: dict[str, Path] = {}
     agents: dict[str, Path] = {}
 
-    for skill_md in plugins_dir.glob("*/skills/*/SKILL.md"):
-        fm, _, _ = parse_frontmatter(skill_md.read_text())
-        name = str(fm.get("name") or skill_md.parent.name)
-        skills[name] = skill_md
-
-    for agent_md in plugins_dir.glob("*/agents/*.md"):
-        fm, _, _ = parse_frontmatter(agent_md.read_text())
-        name = str(fm.get("name") or agent_md.stem)
-        agents[name] = agent_md
+    for md, (fm, _, _) in parsed.items():
+        parts = md.relative_to(plugins_dir).parts
+        if len(parts) == 4 and parts[1] == "skills" and parts[3] == "SKILL.md":
+            skills[str(fm.get("name") or md.parent.name)] = md
+        elif len(parts) == 3 and parts[1] == "agents":
+            agents[str(fm.get("name") or md.stem)] = md
 
     return skills, agents
 
@@ -131,6 +141,13 @@ def collect_inventory(plugins_dir: Path) -> tuple[dict[str, Path], dict[str, Pat
 LEGACY_REF_RE = re.compile(r"grey-haven-[a-z][a-z0-9-]*")
 BACKTICK_NAME_RE = re.compile(r"`([a-z][a-z0-9-]{2,})`")
 RELATED_AGENTS_HDR = re.compile(r"^##+\s+Related Agents\s*$", re.MULTILINE)
+SECTION_HDR_RE = re.compile(r"^##+\s+", re.MULTILINE)
+RELATED_AGENT_ITEM_RE = re.compile(r"^-\s*`([a-zA-Z0-9_-]+)`", re.MULTILINE)
+COUNTER_EXAMPLE_RE = re.compile(r"\bnot\s+[`'\"]?$")
+CODE_FENCE_RE = re.compile(r"```.*?```", re.DOTALL)
+INTEGRATION_BLOCK_RE = re.compile(
+    r"(?:(?:Works Best With|Integrates With|Complements|Auto-loads)[^\n]*\n(?:[-*][^\n]*\n){0,20})"
+)
 
 # Names that *look* like legacy skill refs but are actually legitimate
 # identifiers (directory paths, repo names, external service project names,
@@ -187,10 +204,10 @@ def check_related_agents(
         return
     section_start = m.end()
     # End at the next ## heading or EOF
-    next_h = re.search(r"^##+\s+", body[section_start:], re.MULTILINE)
+    next_h = SECTION_HDR_RE.search(body[section_start:])
     section_end = section_start + (next_h.start() if next_h else len(body))
     section = body[section_start:section_end]
-    for lm in re.finditer(r"^-\s*`([a-zA-Z0-9_-]+)`", section, re.MULTILINE):
+    for lm in RELATED_AGENT_ITEM_RE.finditer(section):
         name = lm.group(1)
         line = body_offset + body[: section_start + lm.start()].count("\n")
         if name not in known_agents:
@@ -211,7 +228,7 @@ def _is_path_context(body: str, start: int) -> bool:
 def _is_counter_example(body: str, start: int) -> bool:
     """True for 'not `grey-haven-X`' patterns used as deliberate counter-examples."""
     window = body[max(0, start - 20) : start]
-    return bool(re.search(r"\bnot\s+[`'\"]?$", window))
+    return bool(COUNTER_EXAMPLE_RE.search(window))
 
 
 def _is_markdown_link_target(body: str, start: int) -> bool:
@@ -260,11 +277,8 @@ def check_inline_skill_refs(
     false positives on arbitrary variable names in code blocks.
     """
     # Skip code blocks
-    cleaned = re.sub(r"```.*?```", "", body, flags=re.DOTALL)
-    for lm in re.finditer(
-        r"(?:(?:Works Best With|Integrates With|Complements|Auto-loads)[^\n]*\n(?:[-*][^\n]*\n){0,20})",
-        cleaned,
-    ):
+    cleaned = CODE_FENCE_RE.sub("", body)
+    for lm in INTEGRATION_BLOCK_RE.finditer(cleaned):
         block = lm.group(0)
         line0 = body_offset + cleaned[: lm.start()].count("\n")
         for bt in BACKTICK_NAME_RE.finditer(block):
@@ -283,18 +297,15 @@ def check_inline_skill_refs(
 
 
 def lint(plugins_dir: Path, strict: bool, report: Report) -> None:
-    skills, agents = collect_inventory(plugins_dir)
+    parsed = parse_markdown_tree(plugins_dir)
+    skills, agents = collect_inventory(plugins_dir, parsed)
     known_skills = set(skills.keys())
     known_agents = set(agents.keys())
     report.skills_seen = known_skills
     report.agents_seen = known_agents
 
-    # Walk all relevant markdown files
-    for md in plugins_dir.rglob("*.md"):
-        # Skip skill supporting docs that aren't SKILL.md, but keep agents and workflows
-        text = md.read_text(errors="replace")
-        fm, body, body_offset = parse_frontmatter(text)
-
+    # Check every markdown file from the same walk the inventory came from
+    for md, (fm, body, body_offset) in parsed.items():
         if md.name == "SKILL.md":
             check_skill_frontmatter(md, fm, known_skills, report)
             check_related_agents(md, body, body_offset, known_agents, report)
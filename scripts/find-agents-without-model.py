@@ -6,6 +6,15 @@ Find agents without model specifications and suggest appropriate models.
 import re
 from pathlib import Path
 
+# Complex agents should use opus or sonnet
+COMPLEX_AGENT_RE = re.compile(
+    'orchestrat|architect|analyzer|implementer'
+    '|optimizer|coordinator|engineer|troubleshooter'
+)
+
+# Simple agents can use haiku
+SIMPLE_AGENT_RE = re.compile('creator|maintainer|generator')
+
 def has_model_field(file_path):
     """Check if agent has model field in frontmatter."""
     with open(file_path, 'r') as f:
@@ -29,20 +38,9 @@ def suggest_model(file_path):
     """Suggest appropriate model based on agent name and description."""
     name = file_path.stem.lower()
 
-    # Complex agents should use opus or sonnet
-    complex_patterns = [
-        'orchestrat', 'architect', 'analyzer', 'implementer',
-        'optimizer', 'coordinator', 'engineer', 'troubleshooter'
-    ]
-
-    # Simple agents can use haiku
-    simple_patterns = [
-        'creator', 'maintainer', 'generator'
-    ]
-
-    if any(pattern in name for pattern in complex_patterns):
+    if COMPLEX_AGENT_RE.search(name):
         return 'sonnet'
-    elif any(pattern in name for pattern in simple_patterns):
+    elif SIMPLE_AGENT_RE.search(name):
         return 'haiku'
     else:
         return 'sonnet'  # Default to sonnet for uncertain cases
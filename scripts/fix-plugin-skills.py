@@ -62,11 +62,8 @@ def get_declared_skills(plugin_json_path: Path) -> Tuple[List[str], Dict]:
     return declared, config
 
 
-def update_plugin_json(plugin_json_path: Path, actual_skills: List[str], dry_run: bool = False) -> bool:
-    """Update plugin.json with actual skills."""
-    with open(plugin_json_path, 'r') as f:
-        config = json.load(f)
-
+def update_plugin_json(plugin_json_path: Path, config: Dict, actual_skills: List[str], dry_run: bool = False) -> bool:
+    """Update plugin.json with actual skills, reusing the already-parsed config."""
     old_skills = config.get('skills', [])
 
     # Only update if there's a change
@@ -147,7 +144,7 @@ def main():
                     print(f"    - {skill}")
 
             # Fix the plugin.json
-            if update_plugin_json(plugin_json_path, actual_skills, dry_run):
+            if update_plugin_json(plugin_json_path, config, actual_skills, dry_run):
                 if dry_run:
                     print(f"  {BLUE}Would update plugin.json{RESET}")
                 else:
@@ -27,6 +27,7 @@ import os
 import re
 import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
@@ -38,6 +39,35 @@ BLUE = '\033[94m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# Patterns used across validations, compiled once at import
+KEBAB_CASE_RE = re.compile(r'^[a-z0-9-]+$')
+SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+')
+MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+AGENT_TRIGGER_RE = re.compile(
+    r'use\s+(?:when|after|before|proactively)'
+    r'|must\s+be\s+used'
+    r'|automatically\s+invoked'
+    r'|use\s+for'
+)
+SKILL_TRIGGER_RE = re.compile(r'use when|when user|when working|when mentioned|mentions')
+HIGH_VALUE_SKILL_RE = re.compile(
+    r'security|authentication|validation|profiling|observability|quality|performance|tdd'
+)
+
+# Score bands, highest first: (minimum score, color, icon); anything lower is red
+SCORE_BANDS = (
+    (90, GREEN, "🟢"),
+    (70, YELLOW, "🟡"),
+)
+
+
+def score_band(score: int) -> Tuple[str, str]:
+    """Return the (color, icon) pair for a 0-100 score."""
+    for minimum, color, icon in SCORE_BANDS:
+        if score >= minimum:
+            return color, icon
+    return RED, "🔴"
+
 
 class ValidationResult:
     def __init__(self, plugin_name: str):
@@ -80,35 +110,30 @@ class ValidationResult:
         }
 
     def print_results(self, verbose: bool = False):
-        print(f"\n{BOLD}{'='*60}{RESET}")
-        print(f"{BOLD}Plugin: {self.plugin_name}{RESET}")
-        print(f"{BOLD}{'='*60}{RESET}")
+        # Collect the whole block and write it once instead of per line
+        lines = [
+            f"\n{BOLD}{'='*60}{RESET}",
+            f"{BOLD}Plugin: {self.plugin_name}{RESET}",
+            f"{BOLD}{'='*60}{RESET}",
+        ]
 
         if self.errors:
-            print(f"\n{RED}{BOLD}❌ Errors ({len(self.errors)}):{RESET}")
-            for error in self.errors:
-                print(f"  {RED}•{RESET} {error}")
+            lines.append(f"\n{RED}{BOLD}❌ Errors ({len(self.errors)}):{RESET}")
+            lines.extend(f"  {RED}•{RESET} {error}" for error in self.errors)
 
         if self.warnings:
-            print(f"\n{YELLOW}{BOLD}⚠️  Warnings ({len(self.warnings)}):{RESET}")
-            for warning in self.warnings:
-                print(f"  {YELLOW}•{RESET} {warning}")
+            lines.append(f"\n{YELLOW}{BOLD}⚠️  Warnings ({len(self.warnings)}):{RESET}")
+            lines.extend(f"  {YELLOW}•{RESET} {warning}" for warning in self.warnings)
 
         if verbose and self.passed:
-            print(f"\n{GREEN}{BOLD}✓ Passed ({len(self.passed)}):{RESET}")
-            for passed in self.passed:
-                print(f"  {GREEN}•{RESET} {passed}")
+            lines.append(f"\n{GREEN}{BOLD}✓ Passed ({len(self.passed)}):{RESET}")
+            lines.extend(f"  {GREEN}•{RESET} {passed}" for passed in self.passed)
 
         # Score
         score = self.score
-        if score >= 90:
-            color = GREEN
-        elif score >= 70:
-            color = YELLOW
-        else:
-            color = RED
-
-        print(f"\n{BOLD}Score: {color}{score}/100{RESET}")
+        color, _ = score_band(score)
+        lines.append(f"\n{BOLD}Score: {color}{score}/100{RESET}")
+        print("\n".join(lines))
 
 
 def parse_frontmatter(content: str) -> Tuple[Optional[Dict], str]:
@@ -158,7 +183,7 @@ def validate_plugin_structure(plugin_dir: Path, result: ValidationResult):
         result.add_error("plugin.json missing 'name' field")
     else:
         name = config['name']
-        if not re.match(r'^[a-z0-9-]+$', name):
+        if not KEBAB_CASE_RE.match(name):
             result.add_error(f"plugin.json name '{name}' should be kebab-case")
         else:
             result.add_pass(f"plugin.json name '{name}' is kebab-case")
@@ -172,7 +197,7 @@ def validate_plugin_structure(plugin_dir: Path, result: ValidationResult):
         result.add_warning("plugin.json missing 'version' field")
     else:
         version = config['version']
-        if not re.match(r'^\d+\.\d+\.\d+', version):
+        if not SEMVER_RE.match(version):
             result.add_warning(f"version '{version}' should follow semver (e.g., 1.0.0)")
         else:
             result.add_pass(f"version '{version}' follows semver")
@@ -245,14 +270,7 @@ def validate_agent(agent_path: Path, result: ValidationResult):
         desc = frontmatter['description']
 
         # Check for trigger phrases
-        trigger_patterns = [
-            r'use\s+(when|after|before|proactively)',
-            r'must\s+be\s+used',
-            r'automatically\s+invoked',
-            r'use\s+for'
-        ]
-
-        has_trigger = any(re.search(pattern, desc.lower()) for pattern in trigger_patterns)
+        has_trigger = AGENT_TRIGGER_RE.search(desc.lower()) is not None
 
         if not has_trigger:
             result.add_warning(f"Agent {agent_path.name} description lacks clear trigger phrases (e.g., 'Use when...', 'Use PROACTIVELY...')")
@@ -322,7 +340,7 @@ def validate_skill(skill_dir: Path, result: ValidationResult):
         name = frontmatter['name']
         if len(name) > 64:
             result.add_error(f"Skill {skill_dir.name} name too long (>{64} chars)")
-        if not re.match(r'^[a-z0-9-]+$', name):
+        if not KEBAB_CASE_RE.match(name):
             result.add_warning(f"Skill {skill_dir.name} name should be lowercase kebab-case")
 
     if 'description' not in frontmatter:
@@ -334,8 +352,7 @@ def validate_skill(skill_dir: Path, result: ValidationResult):
             result.add_error(f"Skill {skill_dir.name} description too long (>{1024} chars)")
 
         # Check for trigger phrases
-        trigger_keywords = ['use when', 'when user', 'when working', 'when mentioned', 'mentions']
-        has_trigger = any(keyword in desc.lower() for keyword in trigger_keywords)
+        has_trigger = SKILL_TRIGGER_RE.search(desc.lower()) is not None
 
         if not has_trigger:
             result.add_warning(f"Skill {skill_dir.name} description should include activation triggers")
@@ -393,11 +410,11 @@ def validate_skill_documentation(skill_dir: Path, result: ValidationResult):
 
     # Check for standard documentation directories
     standard_dirs = ['examples', 'reference', 'templates', 'checklists']
-    found_dirs = []
 
-    for dir_name in standard_dirs:
-        if (skill_dir / dir_name).exists():
-            found_dirs.append(dir_name)
+    # One directory listing instead of a stat per standard directory
+    with os.scandir(skill_dir) as entries:
+        subdirs = {entry.name for entry in entries if entry.is_dir()}
+    found_dirs = [dir_name for dir_name in standard_dirs if dir_name in subdirs]
 
     if not found_dirs:
         result.add_warning(f"Skill {skill_name}: No documentation directories (consider adding examples/, reference/)")
@@ -406,16 +423,15 @@ def validate_skill_documentation(skill_dir: Path, result: ValidationResult):
     # Validate each documentation directory
     for dir_name in found_dirs:
         doc_dir = skill_dir / dir_name
+        md_files = list(doc_dir.glob('*.md'))
 
         # Check for INDEX.md
-        index_md = doc_dir / 'INDEX.md'
-        if not index_md.exists():
+        if not any(f.name == 'INDEX.md' for f in md_files):
             result.add_warning(f"Skill {skill_name}: {dir_name}/ missing INDEX.md")
         else:
             result.add_pass(f"Skill {skill_name}: {dir_name}/ has INDEX.md")
 
         # Check for actual content files
-        md_files = list(doc_dir.glob('*.md'))
         if dir_name != 'templates':  # Templates can be various formats
             content_files = [f for f in md_files if f.name != 'INDEX.md']
 
@@ -425,13 +441,22 @@ def validate_skill_documentation(skill_dir: Path, result: ValidationResult):
                 result.add_pass(f"Skill {skill_name}: {dir_name}/ has {len(content_files)} content file(s)")
 
     # Check for checklists in high-value categories
-    high_value_keywords = ['security', 'authentication', 'validation', 'profiling', 'observability', 'quality', 'performance', 'tdd']
-    is_high_value = any(keyword in skill_name.lower() for keyword in high_value_keywords)
+    is_high_value = HIGH_VALUE_SKILL_RE.search(skill_name.lower()) is not None
 
     if is_high_value and 'checklists' not in found_dirs:
         result.add_warning(f"Skill {skill_name}: High-value skill should have checklists/")
 
 
+@lru_cache(maxsize=None)
+def link_target_exists(base_dir: Path, link: str) -> bool:
+    """Resolve a relative link against base_dir and check it exists (memoized).
+
+    Skill docs link to the same targets over and over (INDEX.md, sibling
+    examples), so each (directory, link) pair is only resolved once per run.
+    """
+    return (base_dir / link).resolve().exists()
+
+
 def validate_documentation_links(file_path: Path, result: ValidationResult):
     """Validate that links in documentation point to existing files."""
     try:
@@ -441,8 +466,7 @@ def validate_documentation_links(file_path: Path, result: ValidationResult):
         return
 
     # Find markdown links [text](path)
-    link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    matches = re.findall(link_pattern, content)
+    matches = MARKDOWN_LINK_RE.findall(content)
 
     broken_links = []
     for text, link in matches:
@@ -451,9 +475,7 @@ def validate_documentation_links(file_path: Path, result: ValidationResult):
             continue
 
         # Resolve relative path
-        link_path = (file_path.parent / link).resolve()
-
-        if not link_path.exists():
+        if not link_target_exists(file_path.parent, link):
             broken_links.append(f"{text} -> {link}")
 
     if broken_links:
@@ -599,16 +621,7 @@ def main():
 
         for result in sorted_results:
             score = result.score
-            if score >= 90:
-                color = GREEN
-                icon = "🟢"
-            elif score >= 70:
-                color = YELLOW
-                icon = "🟡"
-            else:
-                color = RED
-                icon = "🔴"
-
+            color, icon = score_band(score)
             print(f"  {icon} {result.plugin_name:30} {color}{score:3d}/100{RESET}")
 
     # Exit code
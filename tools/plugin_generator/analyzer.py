@@ -1,9 +1,14 @@
 """Analyzer for .claude directory structure."""
 
 import os
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# Tooling, cache and vendored directories that never hold commands, agents or hooks
+PRUNE_DIRS = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv", "venv",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache"
+})
+
 
 def scan_claude_directory(base_path: str) -> Dict[str, List[Dict[str, Any]]]:
     """
@@ -48,22 +53,19 @@ def analyze_commands(claude_path: str) -> List[Dict[str, Any]]:
     commands = []
     commands_dir = os.path.join(claude_path, "commands")
 
-    if not os.path.exists(commands_dir):
-        return commands
+    # Walk through commands directory (os.walk yields nothing if it is missing)
+    for root, dirs, files in os.walk(commands_dir):
+        # Prune cache and vendored directories before descending into them
+        dirs[:] = [d for d in dirs if d not in PRUNE_DIRS]
+
+        # Determine category from subdirectory once per directory
+        category = os.path.relpath(root, commands_dir)
+        if category == os.curdir:
+            category = None
 
-    # Walk through commands directory
-    for root, _, files in os.walk(commands_dir):
         for file in files:
             if file.endswith(".md"):
                 file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, commands_dir)
-
-                # Determine category from subdirectory
-                path_parts = Path(relative_path).parts
-                if len(path_parts) > 1:
-                    category = str(Path(*path_parts[:-1]))
-                else:
-                    category = None
 
                 commands.append({
                     "name": file,
@@ -89,22 +91,19 @@ def analyze_agents(claude_path: str) -> List[Dict[str, Any]]:
     agents = []
     agents_dir = os.path.join(claude_path, "agents")
 
-    if not os.path.exists(agents_dir):
-        return agents
+    # Walk through agents directory (os.walk yields nothing if it is missing)
+    for root, dirs, files in os.walk(agents_dir):
+        # Prune cache and vendored directories before descending into them
+        dirs[:] = [d for d in dirs if d not in PRUNE_DIRS]
+
+        # Determine category from subdirectory once per directory
+        category = os.path.relpath(root, agents_dir)
+        if category == os.curdir:
+            category = None
 
-    # Walk through agents directory
-    for root, _, files in os.walk(agents_dir):
         for file in files:
             if file.endswith(".md"):
                 file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, agents_dir)
-
-                # Determine category from subdirectory
-                path_parts = Path(relative_path).parts
-                if len(path_parts) > 1:
-                    category = str(Path(*path_parts[:-1]))
-                else:
-                    category = None
 
                 agents.append({
                     "name": file,
@@ -130,22 +129,19 @@ def analyze_hooks(claude_path: str) -> List[Dict[str, Any]]:
     hooks = []
     hooks_dir = os.path.join(claude_path, "hooks")
 
-    if not os.path.exists(hooks_dir):
-        return hooks
+    # Walk through hooks directory (os.walk yields nothing if it is missing)
+    for root, dirs, files in os.walk(hooks_dir):
+        # Prune cache and vendored directories before descending into them
+        dirs[:] = [d for d in dirs if d not in PRUNE_DIRS]
+
+        # Determine category from subdirectory once per directory
+        category = os.path.relpath(root, hooks_dir)
+        if category == os.curdir:
+            category = None
 
-    # Walk through hooks directory
-    for root, _, files in os.walk(hooks_dir):
         for file in files:
             # Include all files in hooks directory (any extension or no extension)
             file_path = os.path.join(root, file)
-            relative_path = os.path.relpath(file_path, hooks_dir)
-
-            # Determine category from subdirectory
-            path_parts = Path(relative_path).parts
-            if len(path_parts) > 1:
-                category = str(Path(*path_parts[:-1]))
-            else:
-                category = None
 
             hooks.append({
                 "name": file,
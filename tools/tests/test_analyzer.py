@@ -257,4 +257,42 @@ class TestClaudeAnalyzer:
         hook_names = [h["name"] for h in hooks]
         for i, ext in enumerate(extensions):
             assert f"hook{i}{ext}" in hook_names
-        assert "executable_hook" in hook_names
\ No newline at end of file
+        assert "executable_hook" in hook_names
+
+    def test_category_for_root_and_nested_agents(self):
+        """Test that root files have no category and nested files use their subdirectory."""
+        agents_dir = os.path.join(self.claude_dir, "agents")
+        nested_dir = os.path.join(agents_dir, "review", "security")
+        os.makedirs(nested_dir)
+
+        with open(os.path.join(agents_dir, "root-agent.md"), "w") as f:
+            f.write("# Root Agent")
+
+        with open(os.path.join(nested_dir, "auditor.md"), "w") as f:
+            f.write("# Auditor")
+
+        agents = {agent["name"]: agent for agent in analyze_agents(self.claude_dir)}
+
+        assert agents["root-agent.md"]["category"] is None
+        assert agents["auditor.md"]["category"] == os.path.join("review", "security")
+
+    def test_cache_and_vendor_directories_are_skipped(self):
+        """Test that __pycache__ and node_modules contents are not reported as hooks."""
+        hooks_dir = os.path.join(self.claude_dir, "hooks")
+        pycache_dir = os.path.join(hooks_dir, "__pycache__")
+        vendor_dir = os.path.join(hooks_dir, "node_modules", "left-pad")
+        os.makedirs(pycache_dir)
+        os.makedirs(vendor_dir)
+
+        with open(os.path.join(hooks_dir, "pre-commit.py"), "w") as f:
+            f.write("# Hook")
+
+        with open(os.path.join(pycache_dir, "pre-commit.cpython-311.pyc"), "wb") as f:
+            f.write(b"\x00")
+
+        with open(os.path.join(vendor_dir, "index.js"), "w") as f:
+            f.write("module.exports = () => {}")
+
+        hooks = analyze_hooks(self.claude_dir)
+
+        assert [hook["name"] for hook in hooks] == ["pre-commit.py"]